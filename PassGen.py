@@ -9,27 +9,75 @@ License: MIT
 import argparse
 import itertools
 import json
+import operator
 import os
 import re
 import string
 import sys
 import time
-from collections import Counter, defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Set, List, Dict, Optional, Any, Tuple
+from typing import Set, List, Dict, Optional, Any, Tuple, Iterable, Iterator, Callable
 from urllib.parse import urlparse
 
 # Optional imports with graceful fallback
 try:
     import requests
-    from bs4 import BeautifulSoup
     WEB_SCRAPING_AVAILABLE = True
 except ImportError:
     WEB_SCRAPING_AVAILABLE = False
+
+# HTML parsing streams pages through lxml's incremental parser when available,
+# so a page is never held whole in memory; otherwise pages are downloaded and
+# parsed with the C-backed selectolax (lexbor) parser, falling back to
+# BeautifulSoup's pure-Python html.parser
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        if not LXML_AVAILABLE:
+            WEB_SCRAPING_AVAILABLE = False
+
+if not WEB_SCRAPING_AVAILABLE:
     print("[!] Warning: requests/beautifulsoup4 not installed. Web scraping disabled.")
-    print("[!] Install with: pip install requests beautifulsoup4")
+    print("[!] Install with: pip install requests beautifulsoup4 (or lxml / selectolax)")
+
+# Faster JSON encoding for the statistics file, falling back to the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Word and email extraction patterns, compiled once for every scraped page
+WORD_RE = re.compile(r'\b[a-zA-Z0-9]{3,20}\b')
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Character class lookup table for the complexity filters: every ASCII
+# character maps to the tag of its class (Upper, Lower, Digit, Special) or is
+# dropped, so a single str.translate() classifies a whole password
+SPECIAL_CHARS = '!@#$%^&*()_+-=[]{}|;:,.<>?'
+CHAR_CLASS_TABLE = str.maketrans({
+    chr(c): (
+        'U' if chr(c) in string.ascii_uppercase else
+        'L' if chr(c) in string.ascii_lowercase else
+        'D' if chr(c) in string.digits else
+        'S' if chr(c) in SPECIAL_CHARS else None
+    )
+    for c in range(128)
+})
 
 
 class PasswordGenerator:
@@ -65,10 +113,55 @@ class PasswordGenerator:
         'password', 'passw0rd', 'p@ssw0rd'
     ]
     
+    # Pattern character mappings
+    PATTERN_MAPPINGS = {
+        '@': string.ascii_lowercase,
+        ',': string.ascii_uppercase,
+        '%': string.digits,
+        '^': '!@#$%^&*',
+        '?': string.ascii_letters,
+        'd': string.digits,
+        'l': string.ascii_lowercase,
+        'u': string.ascii_uppercase,
+        's': '!@#$%^&*()_+-='
+    }
+    
+    # Relative frequency of characters at a password position, used to
+    # spend pattern budgets on likely characters first (approximate values
+    # from leaked password corpora; uppercase is rarer than lowercase)
+    LETTER_FREQ = {
+        'a': 10.5, 'e': 8.5, 'i': 6.8, 'o': 6.1, 'n': 6.0, 'r': 5.9, 'l': 5.4,
+        's': 5.2, 't': 4.4, 'm': 3.8, 'y': 3.2, 'c': 3.1, 'h': 3.0, 'd': 3.0,
+        'u': 2.9, 'b': 2.4, 'k': 2.2, 'g': 2.1, 'p': 2.0, 'j': 1.7, 'v': 1.1,
+        'f': 1.0, 'w': 1.0, 'z': 0.9, 'x': 0.6, 'q': 0.3
+    }
+    CHAR_PRIORS = {
+        **LETTER_FREQ,
+        **{c.upper(): f / 10 for c, f in LETTER_FREQ.items()},
+        '1': 20.0, '2': 13.0, '0': 12.0, '3': 9.5, '4': 8.0,
+        '5': 7.5, '6': 7.0, '7': 7.5, '8': 7.0, '9': 8.5,
+        '!': 30.0, '.': 12.0, '@': 11.0, '*': 8.0, '_': 8.0, '-': 7.0,
+        '#': 6.0, '$': 5.0, '&': 3.0, '%': 2.0, '+': 1.5, '=': 1.5,
+        '^': 1.0, '(': 1.0, ')': 1.0
+    }
+    
+    # Deletes vowels in a single str.translate() call
+    NO_VOWELS_TABLE = str.maketrans('', '', 'aeiouAEIOU')
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.stats = defaultdict(int)
         
+        # Mutation rules resolved once, so the mutation phase does no config
+        # lookups or list slicing per call
+        self._basic_suffixes = self.COMMON_SUFFIXES[:10]
+        self._leet = bool(config.get('leet', False))
+        
+        # Years around the current one, as full and two-digit suffixes
+        self._current_year = datetime.now().year
+        self._year_strings = [str(self._current_year + offset) for offset in range(-2, 3)]
+        self._year_suffixes = [year[-2:] for year in self._year_strings]
+        
     def mutate_word(self, word: str, level: int = 1) -> Set[str]:
         """
         Apply intelligent mutations to a word
@@ -76,148 +169,237 @@ class PasswordGenerator:
         Level 2: Advanced (leetspeak, combinations)
         Level 3: Extreme (all variations)
         """
-        mutations = {word}
-        
         if not word:
+            return {word}
+            
+        return self.mutate_words([word], level)
+    
+    def mutate_words(self, words: Iterable[str], level: int = 1) -> Set[str]:
+        """
+        Apply mutate_word to a batch of words at once
+        Each transformation is swept over the whole batch so the per-word
+        setup (suffix slicing, year strings, config lookups) happens once.
+        """
+        words = [w for w in words if w]
+        mutations = set(words)
+        
+        if not words:
             return mutations
             
         # Level 1: Basic mutations
-        mutations.add(word.lower())
-        mutations.add(word.upper())
-        mutations.add(word.capitalize())
-        mutations.add(word.title())
+        mutations.update(map(str.lower, words))
+        mutations.update(map(str.upper, words))
+        capitalized = list(map(str.capitalize, words))
+        mutations.update(capitalized)
+        mutations.update(map(str.title, words))
         
         # Add common suffixes
-        for suffix in self.COMMON_SUFFIXES[:10 if level == 1 else None]:
-            mutations.add(word + suffix)
-            mutations.add(word.capitalize() + suffix)
+        for suffix in self._basic_suffixes if level == 1 else self.COMMON_SUFFIXES:
+            mutations.update([w + suffix for w in words])
+            mutations.update([c + suffix for c in capitalized])
             
         # Add year patterns
-        current_year = datetime.now().year
-        for year_offset in range(-2, 3):
-            year = str(current_year + year_offset)
-            mutations.add(word + year)
-            mutations.add(word + year[-2:])
+        for year in self._year_strings:
+            mutations.update([w + year for w in words])
+        for year in self._year_suffixes:
+            mutations.update([w + year for w in words])
             
         if level >= 2:
             # Level 2: Advanced mutations
             # Reverse
-            mutations.add(word[::-1])
+            mutations.update([w[::-1] for w in words])
             
             # Double
-            if len(word) <= 8:
-                mutations.add(word * 2)
+            mutations.update([w * 2 for w in words if len(w) <= 8])
                 
             # Remove vowels
-            no_vowels = ''.join(c for c in word if c.lower() not in 'aeiou')
-            if no_vowels and len(no_vowels) >= 3:
-                mutations.add(no_vowels)
+            no_vowels = [w.translate(self.NO_VOWELS_TABLE) for w in words]
+            mutations.update([nv for nv in no_vowels if len(nv) >= 3])
                 
             # Leetspeak (limited to prevent explosion)
-            if self.config.get('leet', False):
-                leet_variants = self._apply_leetspeak(word, max_variants=5)
-                mutations.update(leet_variants)
+            if self._leet:
+                for word in words:
+                    mutations.update(self._apply_leetspeak(word, max_variants=5))
                 
         if level >= 3:
             # Level 3: Extreme mutations
             # All prefix combinations
+            lowered = list(map(str.lower, words))
             for prefix in self.COMMON_PREFIXES:
-                if not word.lower().startswith(prefix):
-                    mutations.add(prefix + word)
-                    mutations.add(prefix + '_' + word)
+                for word, low in zip(words, lowered):
+                    if not low.startswith(prefix):
+                        mutations.add(prefix + word)
+                        mutations.add(prefix + '_' + word)
                     
             # Character substitution
-            mutations.add(word.replace('a', '@').replace('s', '$'))
-            mutations.add(word.replace('e', '3').replace('o', '0'))
+            mutations.update([w.replace('a', '@').replace('s', '$') for w in words])
+            mutations.update([w.replace('e', '3').replace('o', '0') for w in words])
             
         return mutations
     
     def _apply_leetspeak(self, word: str, max_variants: int = 5) -> Set[str]:
-        """Apply leetspeak transformations with controlled explosion"""
+        """
+        Apply leetspeak transformations with controlled explosion
+        Each distinct leetable letter is either kept or replaced everywhere it
+        occurs (in both cases). Variants are enumerated lazily, fewest
+        substitutions first and primary replacements before alternates, and
+        capped.
+        """
+        letters = [c for c in self.LEET_MAP if c in word or c.upper() in word]
+        cap = max_variants * 2
         variants = {word}
         
-        for char, replacements in self.LEET_MAP.items():
-            if char in word.lower():
-                new_variants = set()
-                for variant in list(variants)[:max_variants]:
-                    for replacement in replacements:
-                        new_variant = variant.replace(char, replacement)
-                        new_variant2 = variant.replace(char.upper(), replacement)
-                        new_variants.add(new_variant)
-                        new_variants.add(new_variant2)
-                        
-                variants.update(new_variants)
-                if len(variants) > max_variants * 2:
-                    break
-                    
-        return set(list(variants)[:max_variants * 2])
+        for count in range(1, len(letters) + 1):
+            for swaps in range(count + 1):
+                for chosen in itertools.combinations(letters, count):
+                    alternates = [c for c in chosen if len(self.LEET_MAP[c]) > 1]
+                    for secondary in itertools.combinations(alternates, swaps):
+                        variant = word
+                        for char in chosen:
+                            rep = self.LEET_MAP[char][1 if char in secondary else 0]
+                            variant = variant.replace(char, rep).replace(char.upper(), rep)
+                        variants.add(variant)
+                        if len(variants) >= cap:
+                            return variants
+                            
+        return variants
     
     def generate_combinations(self, words: List[str], max_length: int = 32) -> Set[str]:
-        """Generate intelligent word combinations"""
+        """
+        Generate intelligent word combinations
+        Combinations are enumerated as index pairs/triples over the word list,
+        with lengths and capitalized forms precomputed once per word.
+        """
         combinations = set()
         
         # Limit words to prevent explosion
         words = words[:30]
+        lengths = [len(w) for w in words]
+        capitalized = [w.capitalize() for w in words]
         
         # Two-word combinations
-        for w1, w2 in itertools.combinations(words, 2):
-            if len(w1) + len(w2) <= max_length:
-                combinations.add(w1 + w2)
-                combinations.add(w2 + w1)
-                combinations.add(w1.capitalize() + w2.capitalize())
-                combinations.add(w1 + '_' + w2)
-                combinations.add(w1 + '.' + w2)
-                combinations.add(w1 + '-' + w2)
+        pairs = [
+            (i, j) for i, j in itertools.combinations(range(len(words)), 2)
+            if lengths[i] + lengths[j] <= max_length
+        ]
+        combinations.update([words[i] + words[j] for i, j in pairs])
+        combinations.update([words[j] + words[i] for i, j in pairs])
+        combinations.update([capitalized[i] + capitalized[j] for i, j in pairs])
+        for sep in ('_', '.', '-'):
+            combinations.update([words[i] + sep + words[j] for i, j in pairs])
                 
         # Three-word combinations (very limited)
         if len(words) >= 3:
-            for combo in itertools.combinations(words[:10], 3):
-                combined = ''.join(combo)
-                if len(combined) <= max_length:
-                    combinations.add(combined)
-                    combinations.add(''.join(c.capitalize() for c in combo))
+            triples = [
+                (i, j, k) for i, j, k in itertools.combinations(range(min(len(words), 10)), 3)
+                if lengths[i] + lengths[j] + lengths[k] <= max_length
+            ]
+            combinations.update([words[i] + words[j] + words[k] for i, j, k in triples])
+            combinations.update([
+                capitalized[i] + capitalized[j] + capitalized[k] for i, j, k in triples
+            ])
                     
         return combinations
     
     def generate_from_pattern(self, pattern: str, limit: int = 1000) -> Set[str]:
-        """Generate passwords from pattern masks"""
-        results = set()
+        """
+        Generate passwords from pattern masks
+        The limit is a budget that is divided and conquered (D&C-GEN style):
+        at each position it is split across the candidate characters in
+        proportion to CHAR_PRIORS, and only subtrees that receive a share are
+        expanded. A subtree whose share covers its whole keyspace is
+        enumerated in one go with itertools.product.
+        """
+        charsets = [self.PATTERN_MAPPINGS.get(char, char) for char in pattern]
+        strides = self._pattern_strides(charsets)
         
-        # Pattern character mappings
-        mappings = {
-            '@': string.ascii_lowercase,
-            ',': string.ascii_uppercase,
-            '%': string.digits,
-            '^': '!@#$%^&*',
-            '?': string.ascii_letters,
-            'd': string.digits,
-            'l': string.ascii_lowercase,
-            'u': string.ascii_uppercase,
-            's': '!@#$%^&*()_+-='
-        }
+        # Each position's characters ranked by prior, with their weights and
+        # total, computed once for the whole expansion
+        ranked = []
+        for charset in charsets:
+            chars = sorted(charset, key=lambda c: -self.CHAR_PRIORS.get(c, 1.0))
+            weights = [self.CHAR_PRIORS.get(c, 1.0) for c in chars]
+            ranked.append((chars, weights, sum(weights)))
+            
+        # Most likely completion from each position onwards
+        best_tails = [''.join(chars[0] for chars, _, _ in ranked[pos:]) for pos in range(len(ranked))]
+        best_tails.append('')
         
-        def _generate(pattern: str, current: str = ''):
-            if len(results) >= limit:
-                return
-                
-            if not pattern:
-                results.add(current)
-                return
-                
-            char = pattern[0]
-            remaining = pattern[1:]
-            
-            if char in mappings:
-                # Limit characters to prevent explosion
-                chars_to_use = mappings[char][:5] if len(mappings[char]) > 5 else mappings[char]
-                for replacement in chars_to_use:
-                    _generate(remaining, current + replacement)
-            else:
-                _generate(remaining, current + char)
-                
-        _generate(pattern)
+        results = set()
+        if limit > 0:
+            self._expand_pattern(charsets, strides, ranked, best_tails, 0, '', limit, results)
         return results
     
+    def _expand_pattern(self, charsets: List[str], strides: List[int],
+                        ranked: List[Tuple[List[str], List[float], float]], best_tails: List[str],
+                        pos: int, prefix: str, budget: int, results: Set[str]) -> None:
+        """Emit `budget` passwords from the pattern subtree below `prefix`"""
+        if pos == len(charsets) or budget == 1:
+            results.add(prefix + best_tails[pos])
+            return
+            
+        charset = charsets[pos]
+        subtree = strides[pos]
+        
+        # Budget covers everything below this node: enumerate it directly
+        if budget >= subtree * len(charset):
+            results.update(map(prefix.__add__, map(''.join, itertools.product(*charsets[pos:]))))
+            return
+            
+        chars, weights, total = ranked[pos]
+        if len(chars) == 1:
+            self._expand_pattern(charsets, strides, ranked, best_tails, pos + 1,
+                                 prefix + chars[0], budget, results)
+            return
+            
+        # Fewer passwords than characters: one each for the most likely ones
+        if budget < len(chars):
+            for char in chars[:budget]:
+                results.add(prefix + char + best_tails[pos + 1])
+            return
+            
+        for char, share in zip(chars, self._split_budget(budget, weights, total, subtree)):
+            if share:
+                self._expand_pattern(charsets, strides, ranked, best_tails, pos + 1,
+                                     prefix + char, share, results)
+    
+    @staticmethod
+    def _split_budget(budget: int, weights: List[float], total: float, cap: int) -> List[int]:
+        """
+        Split an integer budget across children in proportion to their weights
+        Weights come sorted most likely first. Children whose share exceeds
+        their keyspace (cap) are filled and the excess is re-split among the
+        rest; fractional units go to the largest remainders, so shares that
+        round to nothing are pruned.
+        """
+        shares = []
+        k = 0
+        while k < len(weights) and budget * weights[k] >= cap * total:
+            shares.append(cap)
+            budget -= cap
+            total -= weights[k]
+            k += 1
+            
+        rest = weights[k:]
+        if not rest or budget <= 0:
+            return shares + [0] * len(rest)
+            
+        exact = [budget * w / total for w in rest]
+        floors = [int(x) for x in exact]
+        leftover = budget - sum(floors)
+        for i in sorted(range(len(rest)), key=lambda i: floors[i] - exact[i])[:leftover]:
+            floors[i] += 1
+            
+        return shares + floors
+    
+    @staticmethod
+    def _pattern_strides(charsets: List[str]) -> List[int]:
+        """Keyspace size below each pattern position (suffix product of charset sizes)"""
+        strides = [1] * len(charsets)
+        for pos in range(len(charsets) - 2, -1, -1):
+            strides[pos] = strides[pos + 1] * len(charsets[pos + 1])
+        return strides
+    
     def generate_keyboard_walks(self) -> Set[str]:
         """Generate keyboard walk patterns"""
         walks = set(self.KEYBOARD_WALKS)
@@ -236,7 +418,7 @@ class PasswordGenerator:
         dates = set()
         
         if not end_year:
-            end_year = datetime.now().year + 2
+            end_year = self._current_year + 2
             
         # Years
         for year in range(start_year, end_year):
@@ -275,6 +457,15 @@ class WebScraper:
         words = set()
         visited = set()
         
+        def _extract_text(text: str):
+            # Extract words (3+ chars, alphanumeric)
+            words.update(map(str.lower, WORD_RE.findall(text)))
+            
+            # Extract emails and usernames
+            for email in EMAIL_RE.findall(text):
+                username = email.split('@')[0]
+                words.add(username.lower())
+                
         def _scrape_page(page_url: str, current_depth: int):
             if current_depth > depth or page_url in visited:
                 return
@@ -282,36 +473,24 @@ class WebScraper:
             visited.add(page_url)
             
             try:
-                response = self.session.get(page_url, timeout=5)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                text = soup.get_text()
-                
-                # Extract words (3+ chars, alphanumeric)
-                found_words = re.findall(r'\b[a-zA-Z0-9]{3,20}\b', text)
-                words.update(w.lower() for w in found_words)
-                
-                # Extract emails and usernames
-                emails = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
-                for email in emails:
-                    username = email.split('@')[0]
-                    words.add(username.lower())
+                with self.session.get(page_url, timeout=5, stream=LXML_AVAILABLE) as response:
+                    response.raise_for_status()
+                    
+                    if LXML_AVAILABLE:
+                        meta_contents, links = self._stream_html(response, _extract_text)
+                    else:
+                        text, meta_contents, links = self._parse_html(response.text)
+                        _extract_text(text)
                     
                 # Extract from meta tags
-                for meta in soup.find_all('meta'):
-                    content = meta.get('content', '')
-                    if content:
-                        meta_words = re.findall(r'\b[a-zA-Z0-9]{3,20}\b', content)
-                        words.update(w.lower() for w in meta_words)
+                for content in meta_contents:
+                    words.update(map(str.lower, WORD_RE.findall(content)))
                         
                 # Follow internal links if depth allows
                 if current_depth < depth:
                     base_domain = urlparse(page_url).netloc
-                    links = soup.find_all('a', href=True)
                     
-                    for link in links[:10]:  # Limit links per page
-                        href = link['href']
+                    for href in links[:10]:  # Limit links per page
                         if href.startswith('http'):
                             if urlparse(href).netloc == base_domain:
                                 _scrape_page(href, current_depth + 1)
@@ -323,6 +502,67 @@ class WebScraper:
         _scrape_page(url, 0)
         return words
     
+    @staticmethod
+    def _stream_html(response: Any, on_text: Callable[[str], None]) -> Tuple[List[str], List[str]]:
+        """
+        Parse a page incrementally as it downloads
+        Text is handed to on_text as each element closes, and the element's
+        children are then discarded, so the DOM never fully materializes.
+        Returns the meta tag contents and link targets.
+        """
+        # Decode with the charset from the HTTP headers, as response.text would;
+        # lxml alone only sees the raw bytes and a <meta> declaration, if any
+        parser = etree.HTMLPullParser(events=('end',),
+                                      encoding=response.encoding or response.apparent_encoding)
+        meta_contents = []
+        links = []
+        
+        def _drain():
+            for _, elem in parser.read_events():
+                if elem.tag == 'meta' and elem.get('content'):
+                    meta_contents.append(elem.get('content'))
+                elif elem.tag == 'a' and elem.get('href') is not None:
+                    links.append(elem.get('href'))
+                    
+                # An element's own text plus the tails of its (closed) children
+                if elem.text and elem.tag not in ('script', 'style'):
+                    on_text(elem.text)
+                for child in elem:
+                    if child.tail:
+                        on_text(child.tail)
+                        
+                # Keep the tail: it is the parent's text, read when the parent closes
+                elem.clear(keep_tail=True)
+                
+        for chunk in response.iter_content(chunk_size=65536):
+            parser.feed(chunk)
+            _drain()
+        parser.close()
+        _drain()
+        
+        return meta_contents, links
+    
+    @staticmethod
+    def _parse_html(html: str) -> Tuple[str, List[str], List[str]]:
+        """
+        Parse a page into its visible text, meta tag contents and link targets
+        Text nodes are joined with a space, matching _stream_html, which sees
+        them one at a time: words on either side of any tag stay separate.
+        """
+        if SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(html)
+            tree.strip_tags(['script', 'style'])
+            text = tree.root.text(separator=' ') if tree.root else ''
+            meta_contents = [node.attributes.get('content') or '' for node in tree.css('meta')]
+            links = [node.attributes.get('href') or '' for node in tree.css('a[href]')]
+        else:
+            soup = BeautifulSoup(html, 'html.parser')
+            text = soup.get_text(' ')
+            meta_contents = [meta.get('content', '') for meta in soup.find_all('meta')]
+            links = [link['href'] for link in soup.find_all('a', href=True)]
+            
+        return text, [c for c in meta_contents if c], links
+    
     def scrape_urls_parallel(self, urls: List[str], depth: int = 1) -> Set[str]:
         """Scrape multiple URLs in parallel"""
         if not WEB_SCRAPING_AVAILABLE:
@@ -345,15 +585,30 @@ class WebScraper:
         return all_words
 
 
+def _mutate_chunk(config: Dict[str, Any], words: List[str], level: int) -> Set[str]:
+    """Mutate one batch of base words in a worker process (module level so it pickles)"""
+    return PasswordGenerator(config).mutate_words(words, level)
+
+
 class PassGenPro:
     """Main wordlist generator orchestrator"""
     
+    # Passwords joined per write() call when saving
+    SAVE_CHUNK_SIZE = 65536
+    
+    # Below this many base words per worker, process startup outweighs the mutation work
+    MIN_WORDS_PER_PROCESS = 2000
+    
+    # Base words mutated per batch, bounding how many mutations are held at once
+    MUTATION_BATCH_SIZE = 1000
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.generator = PasswordGenerator(config)
         self.scraper = WebScraper(config)
         self.base_words = set()
         self.wordlist = set()
+        self.rejected = set()  # distinct candidates the filters turned away
         self.stats = {
             'base_words': 0,
             'mutations': 0,
@@ -403,105 +658,153 @@ class PassGenPro:
         self.stats['base_words'] = len(self.base_words)
     
     def generate_from_names(self) -> Set[str]:
-        """Generate passwords from name combinations"""
-        passwords = set()
-        
-        first_names = [n.lower() for n in self.config.get('first_names', [])]
-        last_names = [n.lower() for n in self.config.get('last_names', [])]
-        company = self.config.get('company', '').lower()
-        
-        for first in first_names:
-            for last in last_names:
-                # Basic combinations
-                passwords.add(first + last)
-                passwords.add(last + first)
-                passwords.add(first + '.' + last)
-                passwords.add(first + '_' + last)
-                passwords.add(first[0] + last)
-                passwords.add(first + last[0])
-                
-                # With company
-                if company:
-                    passwords.add(first + company)
-                    passwords.add(first + '@' + company)
-                    passwords.add(first[0] + last[0] + company)
-                    
-                # With common suffixes
-                for suffix in ['123', '2024', '!', '1']:
-                    passwords.add(first + last + suffix)
-                    passwords.add(first[0] + last + suffix)
+        """
+        Generate passwords from name combinations
+        Each variant is built for every (first, last) pair in one comprehension,
+        with the shared pieces (full names, initials) computed once.
+        """
+        first_names = [n.lower() for n in self.config.get('first_names') or []]
+        last_names = [n.lower() for n in self.config.get('last_names') or []]
+        company = (self.config.get('company') or '').lower()
+        
+        pairs = list(itertools.product(first_names, last_names))
+        full_names = [first + last for first, last in pairs]
+        initial_last = [first[0] + last for first, last in pairs]
+        
+        # Basic combinations
+        passwords = set(full_names)
+        passwords.update(initial_last)
+        passwords.update([last + first for first, last in pairs])
+        passwords.update([first + '.' + last for first, last in pairs])
+        passwords.update([first + '_' + last for first, last in pairs])
+        passwords.update([first + last[0] for first, last in pairs])
+        
+        # With company
+        if company and last_names:
+            passwords.update([first + company for first in first_names])
+            passwords.update([first + '@' + company for first in first_names])
+            passwords.update([first[0] + last[0] + company for first, last in pairs])
+            
+        # With common suffixes
+        for suffix in ['123', '2024', '!', '1']:
+            passwords.update([name + suffix for name in full_names])
+            passwords.update([name + suffix for name in initial_last])
                     
         return passwords
     
-    def apply_filters(self) -> None:
-        """Apply length and complexity filters"""
-        filtered = set()
+    @staticmethod
+    def _char_classes(password: str) -> Set[str]:
+        """Character class tags (U/L/D/S) present in a password"""
+        if password.isascii():
+            return set(password.translate(CHAR_CLASS_TABLE))
+            
+        # Non-ASCII letters and digits need the Unicode-aware predicates
+        return {
+            'U' if c.isupper() else 'L' if c.islower() else 'D' if c.isdigit() else
+            'S' if c in SPECIAL_CHARS else ''
+            for c in password
+        }
+    
+    def sort_by_likelihood(self) -> List[str]:
+        """
+        Sort passwords by likelihood score
+        Scores are kept column-wise: one list of passwords and a parallel list
+        of scores, with each scoring signal applied as a single pass.
+        """
+        passwords = list(self.wordlist)
+        lowered = [p.lower() for p in passwords]
+        
+        # Optimal length (8-12 chars)
+        scores = [
+            20 if 8 <= n <= 12 else 10 if 6 <= n <= 16 else 0
+            for n in map(len, passwords)
+        ]
+        
+        # Contains recent year
+        recent_year = re.compile('2023|2024|2025')
+        scores = [s + 15 if recent_year.search(p) else s for s, p in zip(scores, passwords)]
+        
+        # Common patterns
+        common = re.compile('admin|user|pass|123|test')
+        scores = [s + 10 if common.search(low) else s for s, low in zip(scores, lowered)]
+        
+        # Mixed case (case-mapping an ASCII password changes it exactly when it
+        # has a letter of the other case; anything else goes through the
+        # Unicode-aware class check the filters use)
+        mixed = {'U', 'L'}
+        scores = [
+            s + 5 if ((low != p and p.upper() != p) if p.isascii()
+                      else mixed.issubset(self._char_classes(p))) else s
+            for s, p, low in zip(scores, passwords, lowered)
+        ]
+        
+        # Has numbers at end
+        scores = [s + 8 if p and p[-1].isdigit() else s for s, p in zip(scores, passwords)]
+        
+        # Contains base word
+        base_words = [w for w in list(self.base_words)[:20] if len(w) >= 4]
+        if base_words:
+            base = re.compile('|'.join(map(re.escape, base_words)))
+            scores = [s + 25 if base.search(low) else s for s, low in zip(scores, lowered)]
+            
+        # Sort by score (descending) then alphabetically
+        order = sorted(range(len(passwords)), key=lambda i: (-scores[i], passwords[i]))
+        return [passwords[i] for i in order]
+    
+    def _collect(self, passwords: Iterable[str]) -> None:
+        """
+        Stream a batch of candidates into the wordlist
+        Length and complexity filters are applied as each candidate arrives,
+        so the wordlist is never re-filtered. Rejects are deduplicated like the
+        wordlist, so 'filtered' counts each rejected password once.
+        """
         min_len = self.config.get('min_length', 1)
         max_len = self.config.get('max_length', 128)
         
-        for password in self.wordlist:
-            # Length filter
+        # Character classes every password must contain
+        required = {
+            tag for tag, option in (('U', 'require_upper'), ('L', 'require_lower'),
+                                    ('D', 'require_digit'), ('S', 'require_special'))
+            if self.config.get(option)
+        }
+        
+        add = self.wordlist.add
+        reject = self.rejected.add
+        for password in passwords:
             if not (min_len <= len(password) <= max_len):
-                continue
+                reject(password)
+            elif required and not required.issubset(self._char_classes(password)):
+                reject(password)
+            else:
+                add(password)
                 
-            # Complexity filters
-            if self.config.get('require_upper') and not any(c.isupper() for c in password):
-                continue
-            if self.config.get('require_lower') and not any(c.islower() for c in password):
-                continue
-            if self.config.get('require_digit') and not any(c.isdigit() for c in password):
-                continue
-            if self.config.get('require_special'):
-                if not any(c in '!@#$%^&*()_+-=[]{}|;:,.<>?' for c in password):
-                    continue
-                    
-            filtered.add(password)
-            
-        self.stats['filtered'] = len(self.wordlist) - len(filtered)
-        self.wordlist = filtered
+        self.stats['filtered'] = len(self.rejected)
     
-    def sort_by_likelihood(self) -> List[str]:
-        """Sort passwords by likelihood score"""
-        scored = []
+    def _mutate_batches(self, batches: List[List[str]], level: int) -> Iterator[Set[str]]:
+        """
+        Mutate batches of base words, yielding each batch's mutations in order
+        Large inputs can be spread over --processes worker processes (the work
+        is CPU-bound, so never more than there are CPUs), keeping at most two
+        batches per worker in flight so results never pile up faster than they
+        are collected.
+        """
+        words = sum(len(batch) for batch in batches)
+        workers = min(self.config.get('processes', 1), os.cpu_count() or 1,
+                      words // self.MIN_WORDS_PER_PROCESS)
         
-        for password in self.wordlist:
-            score = 0
+        if workers <= 1:
+            for batch in batches:
+                yield self.generator.mutate_words(batch, level=level)
+            return
             
-            # Optimal length (8-12 chars)
-            if 8 <= len(password) <= 12:
-                score += 20
-            elif 6 <= len(password) <= 16:
-                score += 10
-                
-            # Contains recent year
-            for year in ['2023', '2024', '2025']:
-                if year in password:
-                    score += 15
-                    break
-                    
-            # Common patterns
-            if any(p in password.lower() for p in ['admin', 'user', 'pass', '123', 'test']):
-                score += 10
-                
-            # Mixed case
-            if any(c.isupper() for c in password) and any(c.islower() for c in password):
-                score += 5
-                
-            # Has numbers at end
-            if password and password[-1].isdigit():
-                score += 8
-                
-            # Contains base word
-            for word in list(self.base_words)[:20]:
-                if len(word) >= 4 and word in password.lower():
-                    score += 25
-                    break
-                    
-            scored.append((score, password))
-            
-        # Sort by score (descending) then alphabetically
-        scored.sort(key=lambda x: (-x[0], x[1]))
-        return [pwd for score, pwd in scored]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for batch in batches:
+                pending.append(executor.submit(_mutate_chunk, self.config, batch, level))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
     
     def generate(self) -> List[str]:
         """Main generation pipeline"""
@@ -522,9 +825,14 @@ class PassGenPro:
             print("[*] Applying mutations...")
             mutation_level = 2 if self.config.get('leet') else 1
             
-            for word in self.base_words:
-                mutations = self.generator.mutate_word(word, level=mutation_level)
-                self.wordlist.update(mutations)
+            words = list(self.base_words)
+            batches = [
+                words[i:i + self.MUTATION_BATCH_SIZE]
+                for i in range(0, len(words), self.MUTATION_BATCH_SIZE)
+            ]
+            
+            for mutations in self._mutate_batches(batches, mutation_level):
+                self._collect(mutations)
                 self.stats['mutations'] += len(mutations)
         
         # Generate combinations
@@ -535,7 +843,7 @@ class PassGenPro:
                 list(self.base_words)[:50],
                 max_length
             )
-            self.wordlist.update(combinations)
+            self._collect(combinations)
             self.stats['combinations'] = len(combinations)
         
         # Add date patterns
@@ -547,38 +855,35 @@ class PassGenPro:
             )
             
             # Add dates standalone
-            self.wordlist.update(dates)
+            self._collect(dates)
             
-            # Combine with base words (limited)
-            for word in list(self.base_words)[:20]:
-                for date in list(dates)[:20]:
-                    self.wordlist.add(word + date)
-                    self.wordlist.add(date + word)
+            # Combine with base words (limited), as outer products built in C
+            top_words = list(self.base_words)[:20]
+            top_dates = list(dates)[:20]
+            self._collect(itertools.starmap(operator.add, itertools.product(top_words, top_dates)))
+            self._collect(itertools.starmap(operator.add, itertools.product(top_dates, top_words)))
         
         # Add keyboard walks
         if self.config.get('keyboard_walks'):
             print("[*] Adding keyboard patterns...")
             walks = self.generator.generate_keyboard_walks()
-            self.wordlist.update(walks)
+            self._collect(walks)
         
         # Generate from patterns
         if self.config.get('patterns'):
             print("[*] Generating from patterns...")
             for pattern in self.config['patterns']:
                 pattern_passwords = self.generator.generate_from_pattern(pattern)
-                self.wordlist.update(pattern_passwords)
+                self._collect(pattern_passwords)
         
         # Generate from names
         if self.config.get('first_names') and self.config.get('last_names'):
             print("[*] Generating name combinations...")
             name_passwords = self.generate_from_names()
-            self.wordlist.update(name_passwords)
-        
-        # Apply filters
-        print("[*] Applying filters...")
-        self.apply_filters()
+            self._collect(name_passwords)
         
-        # Sort by likelihood if requested
+        # Sort by likelihood if requested (filters were applied as each batch
+        # was collected)
         if self.config.get('smart_order'):
             print("[*] Sorting by likelihood...")
             result = self.sort_by_likelihood()
@@ -596,16 +901,22 @@ class PassGenPro:
     def save(self, passwords: List[str], output_file: str) -> None:
         """Save passwords to file"""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                for password in passwords:
-                    f.write(password + '\n')
+            # Write in large newline-joined chunks rather than one call per line
+            with open(output_file, 'wb', buffering=1 << 20) as f:
+                for i in range(0, len(passwords), self.SAVE_CHUNK_SIZE):
+                    chunk = passwords[i:i + self.SAVE_CHUNK_SIZE]
+                    f.write(('\n'.join(chunk) + '\n').encode('utf-8'))
             print(f"[+] Saved to {output_file}")
             
             # Save statistics if requested
             if self.config.get('save_stats'):
                 stats_file = output_file.replace('.txt', '_stats.json')
-                with open(stats_file, 'w') as f:
-                    json.dump(self.stats, f, indent=2)
+                if ORJSON_AVAILABLE:
+                    with open(stats_file, 'wb') as f:
+                        f.write(orjson.dumps(self.stats, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(stats_file, 'w') as f:
+                        json.dump(self.stats, f, indent=2)
                 print(f"[+] Statistics saved to {stats_file}")
                 
         except Exception as e:
@@ -726,6 +1037,8 @@ PATTERN SYNTAX:
                             help='Verbose output')
     output_group.add_argument('--threads', type=int, default=4,
                             help='Threads for web scraping (default: 4)')
+    output_group.add_argument('--processes', type=int, default=1,
+                            help='Worker processes for mutating large inputs, up to the CPU count (default: 1)')
     
     args = parser.parse_args()
     